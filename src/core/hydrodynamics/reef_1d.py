@@ -1,12 +1,17 @@
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, ClassVar, Optional
 
 import numpy as np
-from scipy.optimize import fsolve
+from pydantic import PrivateAttr, validator
 
 from src.core.base_model import BaseModel
 from src.core.coral.coral_model import Coral
 
+# Convergence criteria of the dispersion relation solve: residual relative to the
+# wave length, and maximum number of Newton iterations.
+_DISPERSION_RTOL = 1e-12
+_DISPERSION_MAXITER = 20
+
 
 class Reef1D(BaseModel):
     """
@@ -26,14 +31,77 @@ class Reef1D(BaseModel):
     can_dia: Optional[Any] = None
     can_height: Optional[Any] = None
     can_den: Optional[Any] = None
-    bath: Optional[Any] = None
-    Hs: Optional[Any] = None
-    Tp: Optional[Any] = None
-    dx: Optional[Any] = None
+    bath: Optional[np.ndarray] = None
+    Hs: Optional[float] = None
+    Tp: Optional[float] = None
+    dx: Optional[float] = None
+    dtype: np.dtype = np.dtype(np.float64)
+
+    # Not modelled yet, hence constant; `depth` has to add the water level to the
+    # bathymetry once it is modelled.
+    vel_wave: ClassVar[float] = 0.0
+    vel_curr_mn: ClassVar[float] = 0.0
+    vel_curr_mx: ClassVar[float] = 0.0
+    water_level: ClassVar[float] = 0.0
+    # Single cross-shore transect, hence one (read-only) y-coordinate.
+    _y_coordinates: ClassVar[np.ndarray] = np.zeros(1)
+    _y_coordinates.setflags(write=False)
+
+    _cache: dict = PrivateAttr(default_factory=dict)
+    _scratch: dict = PrivateAttr(default_factory=dict)
+
+    class Config:
+        """
+        Validates the fields also when they are (re)assigned after creation.
+        """
+
+        validate_assignment = True
+
+    @validator("bath", pre=True)
+    @classmethod
+    def validate_bath(cls, value: Optional[Any]) -> Optional[np.ndarray]:
+        """
+        Transforms the given bathymetry into a contiguous float64 array, so the
+        computations downstream do not need to convert it on every call.
+
+        Args:
+            value (Optional[Any]): Bathymetry as array-like (list, Series, ndarray).
+
+        Returns:
+            Optional[np.ndarray]: Validated bathymetry.
+        """
+        if value is None:
+            return value
+        return np.ascontiguousarray(value, dtype=np.float64)
+
+    @validator("dtype", pre=True)
+    @classmethod
+    def validate_dtype(cls, value: Any) -> np.dtype:
+        """
+        Transforms the given value into the (floating point) data type of the
+        wave properties, e.g. `np.float32` when double precision is not needed.
+        The dispersion relation is always solved in double precision.
+
+        Args:
+            value (Any): Data type or its name.
+
+        Raises:
+            ValueError: When the given data type is not a floating point type.
+
+        Returns:
+            np.dtype: Validated data type.
+        """
+        dtype = np.dtype(value)
+        if not np.issubdtype(dtype, np.floating):
+            raise ValueError(f"Expected a floating point data type, got {dtype}.")
+        return dtype
 
     def __repr__(self):
+        bath = self.bath
+        if bath is not None:
+            bath = np.array2string(bath, threshold=6)
         msg = (
-            f"Reef1D(bathymetry={self.bath}, wave_height={self.Hs}, "
+            f"Reef1D(bathymetry={bath}, wave_height={self.Hs}, "
             f"wave_period={self.Tp})"
         )
         return msg
@@ -47,7 +115,7 @@ class Reef1D(BaseModel):
 
         if self.bath is not None:
             bath_value = type(self.bath).__name__
-            min_max_bath = f"{min(self.bath)}-{max(self.bath)}"
+            min_max_bath = f"{self.bath.min()}-{self.bath.max()}"
             if self.dx is not None:
                 space_dx = self.space * self.dx
 
@@ -66,72 +134,178 @@ class Reef1D(BaseModel):
     def space(self):
         if self.bath is None:
             return None
-        return len(self.bath)
+        return self.bath.shape[0]
 
     @property
     def x_coordinates(self):
-        if self.space is None or self.dx is None:
+        space, dx = self.space, self.dx
+        if space is None or dx is None:
             return None
-        return np.arange(0, self.space, self.dx)
+        return self._cached(
+            "x_coordinates",
+            (space, dx),
+            lambda: dx * np.arange(space, dtype=np.float64),
+        )
 
     @property
     def y_coordinates(self):
-        return np.array([0])
+        return self._y_coordinates
 
     @property
     def xy_coordinates(self):
-        if self.x_coordinates is None:
+        x_coordinates = self.x_coordinates
+        if x_coordinates is None:
             return None
-        return np.array(
-            [
-                [self.x_coordinates[i], self.y_coordinates[0]]
-                for i in range(len(self.x_coordinates))
-            ]
+        return np.column_stack(
+            (x_coordinates, np.full_like(x_coordinates, self.y_coordinates[0]))
         )
 
     @property
-    def vel_wave(self):
-        return 0
+    def per_wav(self):
+        return self.Tp
 
     @property
-    def vel_curr_mn(self):
-        return 0
+    def depth(self):
+        # Water level is constant zero, so the depth is the bathymetry itself.
+        return self.bath
 
-    @property
-    def vel_curr_mx(self):
-        return 0
+    def _cached(self, name: str, key: tuple, compute: Callable[[], Any]) -> Any:
+        """
+        Returns the stored value for `name` as long as its `key` has not changed,
+        otherwise (re)computes and stores it. Stored arrays are made read-only,
+        so callers cannot alter the cached value.
 
-    @property
-    def per_wav(self):
-        return self.Tp
+        Args:
+            name (str): Name of the cached quantity.
+            key (tuple): Inputs the quantity depends on.
+            compute (Callable[[], Any]): Function computing the quantity.
 
-    @property
-    def water_level(self):
-        return 0
+        Returns:
+            Any: The (cached) value.
+        """
+        cached = self._cache.get(name)
+        if cached is None or cached[0] != key:
+            value = compute()
+            if isinstance(value, np.ndarray):
+                value.setflags(write=False)
+            cached = (key, value)
+            self._cache[name] = cached
+        return cached[1]
+
+    def _scratch_buffer(
+        self, name: str, size: int, dtype: np.dtype = np.float64
+    ) -> np.ndarray:
+        """
+        Returns a reusable work array. The array grows with the largest size
+        requested and is kept for the lifetime of the model, so the dispersion
+        solve does not allocate its temporaries on every iteration and call.
+
+        Args:
+            name (str): Name of the work array.
+            size (int): Number of elements required.
+            dtype (np.dtype, optional): Data type of the array. Defaults to np.float64.
+
+        Returns:
+            np.ndarray: View of `size` elements with undefined values.
+        """
+        buffer = self._scratch.get(name)
+        if buffer is None or buffer.size < size or buffer.dtype != dtype:
+            buffer = np.empty(size, dtype=dtype)
+            self._scratch[name] = buffer
+        return buffer[:size]
+
+    def _solve_wave_length(self, depth: np.ndarray) -> np.ndarray:
+        """Solve the dispersion relation for all wet cells with a vectorized
+        Newton iteration; dry cells get a wave length of zero.
+
+        The solution is bracketed by L0 tanh(2pi h / L0) from below and by the
+        smaller of the deep-water (L0 = gT^2/2pi) and shallow-water
+        (L = T sqrt(gh)) wave lengths from above. The iteration starts from the
+        upper bound, so cells well into deep water pass the convergence check
+        right away. Newton steps leaving the (shrinking) bracket are replaced by
+        bisection; this only guards against divergence and is not expected to
+        trigger, as all cells converge within three Newton steps.
+        """
+        L0 = 9.81 * self.per_wav ** 2 / (2 * np.pi)
+        active = np.flatnonzero(depth > 0)
+        h = depth[active]
+        lower = L0 * np.tanh(2 * np.pi * h / L0)
+        upper = np.minimum(L0, self.per_wav * np.sqrt(9.81 * h))
+        wave_length = np.zeros_like(depth)
+        wave_length[active] = upper
+        for _ in range(_DISPERSION_MAXITER):
+            # Work arrays sized to the cells that are still iterated.
+            L, kh, F, dF, work = (
+                self._scratch_buffer(name, active.size)
+                for name in ("L", "kh", "F", "dF", "work")
+            )
+            unconverged, outside, mask = (
+                self._scratch_buffer(name, active.size, dtype=bool)
+                for name in ("unconverged", "outside", "mask")
+            )
+            np.take(wave_length, active, out=L)
+            np.divide(h, L, out=kh)
+            kh *= 2 * np.pi
+            # dF holds tanh(kh) until the derivative is computed.
+            np.tanh(kh, out=dF)
+            np.multiply(L0, dF, out=F)
+            np.subtract(L, F, out=F)
+            np.abs(F, out=work)
+            work /= L
+            np.greater_equal(work, _DISPERSION_RTOL, out=unconverged)
+            if not unconverged.any():
+                break
+            np.greater(F, 0, out=mask)
+            np.copyto(upper, L, where=mask)
+            np.less(F, 0, out=mask)
+            np.copyto(lower, L, where=mask)
+            # dF = 1 + L0 kh / L sech^2(kh), with sech^2(kh) = 1 - tanh^2(kh);
+            # no second transcendental needed.
+            dF *= dF
+            np.subtract(1, dF, out=dF)
+            dF *= kh
+            dF *= L0
+            dF /= L
+            dF += 1
+            F /= dF
+            L -= F
+            np.less(L, lower, out=outside)
+            np.greater(L, upper, out=mask)
+            outside |= mask
+            outside &= unconverged
+            np.add(lower, upper, out=work)
+            work *= 0.5
+            np.copyto(L, work, where=outside)
+            wave_length[active] = L
+            # Converged cells drop out; only the remaining ones are iterated.
+            active, h, lower, upper = (
+                x[unconverged] for x in (active, h, lower, upper)
+            )
+        return wave_length
 
     @property
-    def depth(self):
-        return self.bath + self.water_level
+    def _wave_length(self) -> np.ndarray:
+        """Wave length from the dispersion relation (double precision), only
+        solved again when the wave period or the depth have changed. The cache key
+        holds a byte copy of the depth, so each access costs O(N) to build and
+        compare it; read this property once per computation.
+        """
+        depth = self.depth
+        key = (self.per_wav, depth.dtype.str, depth.tobytes())
+        return self._cached("wave_length", key, lambda: self._solve_wave_length(depth))
 
     @staticmethod
-    def dispersion(wave_length, wave_period, depth, grav_acc):
-        """Dispersion relation to determine the wave length based on the
-        wave period.
-        """
-        func = wave_length - ((grav_acc * wave_period ** 2) / (2 * np.pi)) * np.tanh(
-            2 * np.pi * depth / wave_length
+    def _to_wave_number(wave_length: np.ndarray) -> np.ndarray:
+        return np.divide(
+            2 * np.pi,
+            wave_length,
+            out=np.zeros_like(wave_length),
+            where=wave_length > 0,
         )
-        return func
 
     @property
     def wave_length(self):
-        """Solve the dispersion relation to retrieve the wave length."""
-        L0 = 9.81 * self.per_wav ** 2
-        L = np.zeros(len(self.depth))
-        for i, h in enumerate(self.depth):
-            if h > 0:
-                L[i] = fsolve(self.dispersion, L0, args=(self.per_wav, h, 9.81))
-        return L
+        return self._wave_length.astype(self.dtype, copy=False)
 
     @property
     def wave_frequency(self):
@@ -139,22 +313,29 @@ class Reef1D(BaseModel):
 
     @property
     def wave_number(self):
-        k = np.zeros(len(self.wave_length))
-        k[self.wave_length > 0] = 2 * np.pi / self.wave_length[self.wave_length > 0]
-        return k
+        wave_number = self._to_wave_number(self._wave_length)
+        return wave_number.astype(self.dtype, copy=False)
 
     @property
     def wave_celerity(self):
-        return self.wave_length / self.per_wav
+        wave_celerity = self._wave_length / self.per_wav
+        return wave_celerity.astype(self.dtype, copy=False)
 
     @property
     def group_celerity(self):
-        n = 0.5 * (
-            1
-            + (2 * self.wave_number * self.depth)
-            / (np.sinh(self.wave_number * self.depth))
-        )
-        return n * self.wave_celerity
+        # n * c = (0.5 + kh / sinh(kh)) * L / T, evaluated in place and only
+        # for wet cells; dry cells have no waves (L = 0).
+        wave_length = self._wave_length
+        kh = self._to_wave_number(wave_length)
+        kh *= self.depth
+        wet = kh > 0
+        group_celerity = np.zeros_like(kh)
+        np.sinh(kh, out=group_celerity, where=wet)
+        np.divide(kh, group_celerity, out=group_celerity, where=wet)
+        group_celerity += 0.5
+        group_celerity *= wave_length
+        group_celerity /= self.per_wav
+        return group_celerity.astype(self.dtype, copy=False)
 
     def initiate(self):
         """Initiate hydrodynamic model."""
@@ -5,8 +5,8 @@ from src.core.hydrodynamics.hydrodynamic_protocol import HydrodynamicProtocol
 
 class TestHydrodynamicProtocol:
     """
-    Test fixture which is only meant to verify that all properties and methods
-    in the protocol raise a NotImplementedError as they are meant to be defined
+    Test fixture which is only meant to verify that the properties and methods
+    in the protocol provide no behaviour as they are meant to be defined
     in the binded classes through stric typing (e.g.: testClass: HydrodynamicProtocol)
     """
 
@@ -90,18 +90,11 @@ class TestHydrodynamicProtocol:
 
         test_derived = TestDerived()
 
-        def verify_prop_raises(prop_name: str):
-            with pytest.raises(NotImplementedError):
-                getattr(test_derived, prop_name)
-                pytest.fail(f"Property {prop_name} was supposed to raise.")
+        def verify_prop_is_empty(prop_name: str):
+            assert getattr(test_derived, prop_name) is None
 
-        def verify_method_raises(method_name: str, **kwargs):
-            with pytest.raises(NotImplementedError):
-                if kwargs:
-                    getattr(test_derived, method_name)(**kwargs)
-                else:
-                    getattr(test_derived, method_name)()
-                pytest.fail(f"Method {method_name} was supposed to raise.")
+        def verify_method_is_empty(method_name: str, **kwargs):
+            assert getattr(test_derived, method_name)(**kwargs) is None
 
         props_to_test = [
             "config_file",
@@ -113,7 +106,7 @@ class TestHydrodynamicProtocol:
             "water_depth",
             "space",
         ]
-        list(map(verify_prop_raises, props_to_test))
-        verify_method_raises("initiate")
-        verify_method_raises("update", coral=None, stormcat=None)
-        verify_method_raises("finalise")
+        list(map(verify_prop_is_empty, props_to_test))
+        verify_method_is_empty("initiate")
+        verify_method_is_empty("update", coral=None, stormcat=None)
+        verify_method_is_empty("finalise")
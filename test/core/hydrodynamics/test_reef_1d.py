@@ -1,6 +1,7 @@
 import numpy as np
 import pytest
 
+from src.core.hydrodynamics import reef_1d
 from src.core.hydrodynamics.hydrodynamic_protocol import HydrodynamicProtocol
 from src.core.hydrodynamics.reef_1d import Reef1D
 
@@ -46,13 +47,36 @@ class TestReef1D:
         assert test_reef.settings == (
             "One-dimensional simple hydrodynamic model to simulate the "
             "hydrodynamics on a (coral) reef with the following settings:"
-            "\n\tBathymetric cross-shore data : list"
-            "\n\t\trange [m]  : 4-4"
-            "\n\t\tlength [m] : 1"
+            "\n\tBathymetric cross-shore data : ndarray"
+            "\n\t\trange [m]  : 4.0-4.0"
+            "\n\t\tlength [m] : 1.0"
             "\n\tSignificant wave height [m]  : None"
             "\n\tPeak wave period [s]         : None"
         )
 
+    def test_set_bath_as_float_array(self):
+        test_reef = Reef1D(bath=[4, 3])
+        assert isinstance(test_reef.bath, np.ndarray)
+        assert test_reef.bath.dtype == np.float64
+        test_reef.bath = np.arange(6)[::2]
+        assert test_reef.bath.flags["C_CONTIGUOUS"]
+        assert test_reef.bath.dtype == np.float64
+
+    def test_coordinates(self):
+        test_reef = Reef1D()
+        test_reef.bath = np.array([4, 3, 2])
+        test_reef.dx = 0.5
+        assert test_reef.x_coordinates.tolist() == [0.0, 0.5, 1.0]
+        with pytest.raises(ValueError):
+            test_reef.x_coordinates[1] = 42
+        assert test_reef.y_coordinates.tolist() == [0.0]
+        assert not test_reef.y_coordinates.flags.writeable
+        assert test_reef.xy_coordinates.tolist() == [
+            [0.0, 0.0],
+            [0.5, 0.0],
+            [1.0, 0.0],
+        ]
+
     @pytest.fixture(autouse=False)
     def reef_1d(self) -> Reef1D:
         """
@@ -75,16 +99,62 @@ class TestReef1D:
         reef_1d.can_den = 4.2
         assert reef_1d.can_den == 4.2
 
-    def test_dispersion(self):
-        val = Reef1D.dispersion(4, 2, 2, 4)
-        assert val == pytest.approx(1.463013990480674)
-
     def test_wave_length(self):
         test_ref1d = Reef1D()
         test_ref1d.Tp = 1
         test_ref1d.bath = np.array([1])
         assert test_ref1d.wave_length[0] == pytest.approx(1.56031758)
 
+    def test_wave_length_mixed_depths(self):
+        test_ref1d = Reef1D()
+        test_ref1d.Tp = 8
+        test_ref1d.bath = np.array([0.01, 0.5, 5, 50, 500, 0, -2])
+        wave_length = test_ref1d.wave_length[:5]
+        kh = 2 * np.pi * test_ref1d.bath[:5] / wave_length
+        expected = 9.81 * 8 ** 2 / (2 * np.pi) * np.tanh(kh)
+        assert wave_length == pytest.approx(expected)
+        assert test_ref1d.wave_length[5:].tolist() == [0, 0]
+
+    def test_wave_length_converges_within_three_iterations(self, monkeypatch):
+        # Deep cells (170, 500 m) have their root on the lower bracket bound.
+        monkeypatch.setattr(reef_1d, "_DISPERSION_MAXITER", 3)
+        test_ref1d = Reef1D()
+        test_ref1d.Tp = 8
+        test_ref1d.bath = np.array([0.01, 0.5, 5, 50, 100, 170, 500])
+        wave_length = test_ref1d.wave_length
+        kh = 2 * np.pi * test_ref1d.bath / wave_length
+        expected = 9.81 * 8 ** 2 / (2 * np.pi) * np.tanh(kh)
+        assert wave_length == pytest.approx(expected, rel=1e-10)
+
+    def test_wave_length_is_cached(self):
+        test_ref1d = Reef1D()
+        test_ref1d.Tp = 1
+        test_ref1d.bath = np.array([1])
+        wave_length = test_ref1d.wave_length
+        assert test_ref1d.wave_length is wave_length
+        with pytest.raises(ValueError):
+            wave_length[0] = 999.0
+        assert test_ref1d.wave_length[0] == pytest.approx(1.56031758)
+        test_ref1d.Tp = 2
+        assert test_ref1d.wave_length is not wave_length
+        assert test_ref1d.wave_length[0] > wave_length[0]
+
+    def test_wave_properties_single_precision(self):
+        test_ref1d = Reef1D(dtype="float32")
+        test_ref1d.Tp = 1
+        test_ref1d.bath = np.array([1])
+        assert test_ref1d.wave_length.dtype == np.float32
+        assert test_ref1d.wave_number.dtype == np.float32
+        assert test_ref1d.wave_celerity.dtype == np.float32
+        assert test_ref1d.group_celerity.dtype == np.float32
+        assert test_ref1d.wave_length[0] == pytest.approx(1.56031758, rel=1e-6)
+
+    @pytest.mark.parametrize("dtype", ["int32", "U5", bool])
+    def test_non_float_dtype_raises(self, dtype):
+        with pytest.raises(ValueError) as e_info:
+            Reef1D(dtype=dtype)
+        assert "Expected a floating point data type" in str(e_info.value)
+
     def test_wave_number(self):
         test_ref1d = Reef1D()
         test_ref1d.Tp = 1
@@ -108,6 +178,12 @@ class TestReef1D:
         test_ref1d.bath = np.array([1])
         assert test_ref1d.group_celerity[0] == pytest.approx(1.00429061)
 
+    def test_group_celerity_dry_cell(self):
+        test_ref1d = Reef1D()
+        test_ref1d.Tp = 1
+        test_ref1d.bath = np.array([1, 0, -1])
+        assert test_ref1d.group_celerity.tolist() == pytest.approx([1.00429061, 0, 0])
+
     def test_initiate(self):
         with pytest.raises(NotImplementedError):
             Reef1D().initiate()